@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, replace
 from enum import Enum
 from types import NoneType
-from typing import Any
+from typing import Any, get_origin
 
-from mashumaro import DataClassDictMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from .constants import SECURE_STRING_SUBSTITUTE
 from .enums import ConfigEntryType, ProviderType
@@ -46,24 +46,43 @@ ConfigEntryTypeMap: dict[ConfigEntryType, type[ConfigValueType]] = {
     ConfigEntryType.ICON: str,
 }
 
-UI_ONLY = (
-    ConfigEntryType.LABEL,
-    ConfigEntryType.DIVIDER,
-    ConfigEntryType.ACTION,
-    ConfigEntryType.ALERT,
+UI_ONLY = frozenset(
+    (
+        ConfigEntryType.LABEL,
+        ConfigEntryType.DIVIDER,
+        ConfigEntryType.ACTION,
+        ConfigEntryType.ALERT,
+    )
 )
 
+# ConfigEntryTypeMap with plain types that can be used with isinstance
+_INSTANCE_TYPES: dict[ConfigEntryType, type[ConfigValueType]] = {
+    key: get_origin(value) or value for key, value in ConfigEntryTypeMap.items()
+}
+
+# root values of a Config that can be updated (next to the config entries)
+_ROOT_VALUES = frozenset(("enabled", "name"))
+
+# common conversions/mistakes, keyed by (expected type, actual type) of a value
+_COERCERS: dict[tuple[type, type], Callable[[Any], ConfigValueType]] = {
+    (float, int): float,
+    (float, bool): float,
+    (int, float): int,
+    (int, str): int,
+    (float, str): float,
+}
+
 
-@dataclass
-class ConfigValueOption(DataClassDictMixin):
+@dataclass(frozen=True, slots=True)
+class ConfigValueOption(DataClassORJSONMixin):
     """Model for a value with separated name/value."""
 
     title: str
     value: ConfigValueType
 
 
-@dataclass
-class ConfigEntry(DataClassDictMixin):
+@dataclass(slots=True)
+class ConfigEntry(DataClassORJSONMixin):
     """Model for a Config Entry.
 
     The definition of something that can be configured
@@ -109,30 +128,43 @@ class ConfigEntry(DataClassDictMixin):
         allow_none: bool = True,
     ) -> ConfigValueType:
         """Parse value from the config entry details and plain value."""
-        expected_type = list if self.multi_value else ConfigEntryTypeMap.get(self.type, NoneType)
         if value is None:
             value = self.default_value
+        if (
+            self.type is ConfigEntryType.INTEGER_TUPLE
+            and not self.multi_value
+            and isinstance(value, list | tuple)
+            and len(value) == 2
+        ):
+            # fast path for integer tuples, which are often provided as list
+            items: Sequence[Any] = value
+            try:
+                self.value = (int(items[0]), int(items[1]))
+            except (TypeError, ValueError):
+                pass
+            else:
+                return self.value
+        expected_type = list if self.multi_value else _INSTANCE_TYPES.get(self.type, NoneType)
         if value is None and (not self.required or allow_none):
             expected_type = NoneType
         if self.type == ConfigEntryType.LABEL:
             value = self.label
-        if not isinstance(value, expected_type):
+        # (valid) integer tuples are already returned by the fast path above
+        if not isinstance(value, expected_type) or expected_type is tuple:
             # handle common conversions/mistakes
-            if expected_type is float and isinstance(value, int):
-                self.value = float(value)
-                return self.value
-            if expected_type is int and isinstance(value, float):
-                self.value = int(value)
-                return self.value
-            for val_type in (int, float):
-                # convert int/float from string
-                if expected_type == val_type and isinstance(value, str):
-                    try:
-                        self.value = val_type(value)
-                    except ValueError:
-                        pass
-                    else:
-                        return self.value
+            coerce = _COERCERS.get((expected_type, type(value)))
+            if coerce is None:
+                # no exact match, also convert subclasses (e.g. IntEnum members)
+                for value_type in type(value).__mro__[1:]:
+                    if (coerce := _COERCERS.get((expected_type, value_type))) is not None:
+                        break
+            if coerce is not None:
+                try:
+                    self.value = coerce(value)
+                except ValueError:
+                    pass
+                else:
+                    return self.value
             if self.type in UI_ONLY:
                 self.value = self.default_value
                 return self.value
@@ -151,8 +183,17 @@ class ConfigEntry(DataClassDictMixin):
         return self.value
 
 
-@dataclass
-class Config(DataClassDictMixin):
+def _handle_value(value: ConfigEntry) -> ConfigValueType:
+    """Return the value of a ConfigEntry as it must be stored in persistent storage."""
+    if value.type == ConfigEntryType.SECURE_STRING:
+        assert isinstance(value.value, str)
+        assert ENCRYPT_CALLBACK is not None
+        return ENCRYPT_CALLBACK(value.value)
+    return value.value
+
+
+@dataclass(slots=True)
+class Config(DataClassORJSONMixin):
     """Base Configuration object."""
 
     values: dict[str, ConfigEntry]
@@ -174,28 +215,29 @@ class Config(DataClassDictMixin):
     ) -> Config:
         """Parse Config from the raw values (as stored in persistent storage)."""
         conf = cls.from_dict({**raw, "values": {}})
+        raw_values: dict[str, ConfigValueType] = raw.get("values", {})
         for entry in config_entries:
             # unpack Enum value in default_value
             if isinstance(entry.default_value, Enum):
                 entry.default_value = entry.default_value.value
-            # create a copy of the entry
-            conf.values[entry.key] = ConfigEntry.from_dict(entry.to_dict())
-            conf.values[entry.key].parse_value(
-                raw.get("values", {}).get(entry.key), allow_none=True
+            # create a (shallow) copy of the entry, the (immutable) options tuple
+            # is shared with the entry definition but a (mutable) list default is copied
+            default_value = entry.default_value
+            if isinstance(default_value, list):
+                default_value = default_value.copy()
+            conf.values[entry.key] = conf_entry = replace(
+                entry,
+                default_value=default_value,
+                options=None if entry.options is None else tuple(entry.options),
+                value=None,
             )
+            conf_entry.parse_value(raw_values.get(entry.key), allow_none=True)
         return conf
 
     def to_raw(self) -> dict[str, Any]:
         """Return minimized/raw dict to store in persistent storage."""
-
-        def _handle_value(value: ConfigEntry) -> ConfigValueType:
-            if value.type == ConfigEntryType.SECURE_STRING:
-                assert isinstance(value.value, str)
-                assert ENCRYPT_CALLBACK is not None
-                return ENCRYPT_CALLBACK(value.value)
-            return value.value
-
-        res = self.to_dict()
+        # serialize a copy without values, the values are handled below
+        res = replace(self, values={}).to_dict()
         res["values"] = {
             x.key: _handle_value(x)
             for x in self.values.values()
@@ -218,8 +260,7 @@ class Config(DataClassDictMixin):
         changed_keys: set[str] = set()
 
         # root values (enabled, name)
-        root_values = ("enabled", "name")
-        for key in root_values:
+        for key in _ROOT_VALUES:
             if key not in update:
                 continue
             cur_val = getattr(self, key)
@@ -230,13 +271,13 @@ class Config(DataClassDictMixin):
             changed_keys.add(key)
 
         for key, new_val in update.items():
-            if key in root_values:
+            if key in _ROOT_VALUES:
                 continue
-            if key not in self.values:
+            if (entry := self.values.get(key)) is None:
                 continue
-            cur_val = self.values[key].value if key in self.values else None
+            cur_val = entry.value
             # parse entry to do type validation
-            parsed_val = self.values[key].parse_value(new_val)
+            parsed_val = entry.parse_value(new_val)
             if cur_val != parsed_val:
                 changed_keys.add(f"values/{key}")
 
@@ -250,7 +291,7 @@ class Config(DataClassDictMixin):
             value.parse_value(value.value, allow_none=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig(Config):
     """Provider(instance) Configuration."""
 
@@ -265,7 +306,7 @@ class ProviderConfig(Config):
     last_error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerConfig(Config):
     """Player Configuration."""
 
@@ -281,7 +322,7 @@ class PlayerConfig(Config):
     default_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreConfig(Config):
     """CoreController Configuration."""
 
@@ -6,7 +6,8 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Literal
 
-from mashumaro import DataClassDictMixin
+from mashumaro import DataClassDictMixin, field_options
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from .media_items.audio_format import AudioFormat
 
@@ -20,8 +21,8 @@ class DSPFilterType(StrEnum):
     TONE_CONTROL = "tone_control"
 
 
-@dataclass
-class DSPFilterBase(DataClassDictMixin):
+@dataclass(slots=True)
+class DSPFilterBase(DataClassORJSONMixin):
     """Base model for all DSP filters."""
 
     # Enable/disable this filter
@@ -47,9 +48,17 @@ class ParametricEQBandType(StrEnum):
         """Set default enum member if an unknown value is provided."""
         return cls.UNKNOWN
 
+    @classmethod
+    def from_str(cls, value: str) -> ParametricEQBandType:
+        """Return the enum member for the given value (UNKNOWN if not found)."""
+        return _BAND_TYPES.get(value, cls.UNKNOWN)
+
+
+_BAND_TYPES: dict[str, ParametricEQBandType] = {x.value: x for x in ParametricEQBandType}
+
 
-@dataclass
-class ParametricEQBand(DataClassDictMixin):
+@dataclass(frozen=True, slots=True)
+class ParametricEQBand(DataClassORJSONMixin):
     """Model for a single Parametric EQ band."""
 
     # Center frequency of the band in Hz
@@ -59,12 +68,15 @@ class ParametricEQBand(DataClassDictMixin):
     # Gain in dB, can be negative or positive
     gain: float = 0.0
     # Equalizer band type, changes the behavior of the band
-    type: ParametricEQBandType = ParametricEQBandType.PEAK
+    type: ParametricEQBandType = field(
+        default=ParametricEQBandType.PEAK,
+        metadata=field_options(deserialize=ParametricEQBandType.from_str),
+    )
     # Enable/disable the band
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ParametricEQFilter(DSPFilterBase):
     """Model for a Parametric EQ filter."""
 
@@ -86,7 +98,7 @@ class ParametricEQFilter(DSPFilterBase):
                 raise ValueError("Band gain must be in the range -60.0 to 60.0 dB")
 
 
-@dataclass
+@dataclass(slots=True)
 class ToneControlFilter(DSPFilterBase):
     """Model for a Tone Control filter."""
 
@@ -115,8 +127,8 @@ class ToneControlFilter(DSPFilterBase):
 DSPFilter = ParametricEQFilter | ToneControlFilter
 
 
-@dataclass
-class DSPConfig(DataClassDictMixin):
+@dataclass(slots=True)
+class DSPConfig(DataClassORJSONMixin):
     """Model for a complete DSP configuration."""
 
     # Enable/disable the complete DSP configuration, including input/output stages
@@ -2,25 +2,17 @@
 
 from __future__ import annotations
 
-import contextlib
-from enum import EnumType, IntEnum, StrEnum
+from enum import EnumType, IntEnum, StrEnum, unique
+from typing import Final
 
 
 class MediaTypeMeta(EnumType):
     """Class properties for MediaType."""
 
     @property
-    def ALL(cls) -> list[MediaType]:  # noqa: N802
+    def ALL(cls) -> tuple[MediaType, ...]:  # noqa: N802
         """All MediaTypes."""
-        return [
-            MediaType.ARTIST,
-            MediaType.ALBUM,
-            MediaType.TRACK,
-            MediaType.PLAYLIST,
-            MediaType.RADIO,
-            MediaType.AUDIOBOOK,
-            MediaType.PODCAST,
-        ]
+        return _ALL_MEDIA_TYPES
 
 
 class MediaType(StrEnum, metaclass=MediaTypeMeta):
@@ -46,6 +38,17 @@ class MediaType(StrEnum, metaclass=MediaTypeMeta):
         return cls.UNKNOWN
 
 
+_ALL_MEDIA_TYPES = (
+    MediaType.ARTIST,
+    MediaType.ALBUM,
+    MediaType.TRACK,
+    MediaType.PLAYLIST,
+    MediaType.RADIO,
+    MediaType.AUDIOBOOK,
+    MediaType.PODCAST,
+)
+
+
 class ExternalID(StrEnum):
     """Enum with External ID types."""
 
@@ -71,22 +74,28 @@ class ExternalID(StrEnum):
     @property
     def is_unique(self) -> bool:
         """Return if the ExternalID is unique."""
-        return self.is_musicbrainz or self in (
-            ExternalID.ACOUSTID,
-            ExternalID.DISCOGS,
-            ExternalID.TADB,
-        )
+        return self in _UNIQUE_EXTERNAL_IDS
 
     @property
     def is_musicbrainz(self) -> bool:
         """Return if the ExternalID is a MusicBrainz identifier."""
-        return self in (
-            ExternalID.MB_RELEASEGROUP,
-            ExternalID.MB_ALBUM,
-            ExternalID.MB_TRACK,
-            ExternalID.MB_ARTIST,
-            ExternalID.MB_RECORDING,
-        )
+        return self in _MB_EXTERNAL_IDS
+
+
+_MB_EXTERNAL_IDS = frozenset(
+    {
+        ExternalID.MB_RELEASEGROUP,
+        ExternalID.MB_ALBUM,
+        ExternalID.MB_TRACK,
+        ExternalID.MB_ARTIST,
+        ExternalID.MB_RECORDING,
+    }
+)
+_UNIQUE_EXTERNAL_IDS = _MB_EXTERNAL_IDS | {
+    ExternalID.ACOUSTID,
+    ExternalID.DISCOGS,
+    ExternalID.TADB,
+}
 
 
 class LinkType(StrEnum):
@@ -231,13 +240,13 @@ class ContentType(StrEnum):
         tempstr = string.lower()
         if "audio/" in tempstr:
             tempstr = tempstr.split("/")[1]
-        for splitter in (".", ","):
-            if splitter in tempstr:
-                for val in tempstr.split(splitter):
-                    with contextlib.suppress(ValueError):
-                        parsed = cls(val.strip())
-                    if parsed != ContentType.UNKNOWN:
-                        return parsed
+        # fast path: the string is a known value (or alias)
+        if (content_type := _CONTENT_TYPES.get(tempstr)) is not None:
+            return content_type
+        if "." in tempstr or "," in tempstr:
+            for val in tempstr.translate(_SPLITTER_TABLE).split("."):
+                if (content_type := _CONTENT_TYPES.get(val.strip())) is not None:
+                    return content_type
         tempstr = tempstr.split("?")[0]
         tempstr = tempstr.split("&")[0]
         tempstr = tempstr.split(";")[0]
@@ -250,39 +259,52 @@ class ContentType(StrEnum):
 
     def is_pcm(self) -> bool:
         """Return if contentype is PCM."""
-        return self.name.startswith("PCM")
+        return self in _PCM_CONTENT_TYPES
 
     def is_lossless(self) -> bool:
         """Return if format is lossless."""
-        return self.is_pcm() or self in (
-            ContentType.DSF,
-            ContentType.FLAC,
-            ContentType.AIFF,
-            ContentType.WAV,
-            ContentType.ALAC,
-            ContentType.WAVPACK,
-            ContentType.TAK,
-            ContentType.APE,
-            ContentType.TRUEHD,
-            ContentType.DSD_LSBF,
-            ContentType.DSD_MSBF,
-            ContentType.DSD_LSBF_PLANAR,
-            ContentType.DSD_MSBF_PLANAR,
-            ContentType.RA_144,
-        )
+        return self in _LOSSLESS_CONTENT_TYPES
 
     @classmethod
     def from_bit_depth(cls, bit_depth: int, floating_point: bool = False) -> ContentType:
         """Return (PCM) Contenttype from PCM bit depth."""
-        if floating_point and bit_depth > 32:
-            return cls.PCM_F64LE
         if floating_point:
-            return cls.PCM_F32LE
-        if bit_depth == 16:
-            return cls.PCM_S16LE
-        if bit_depth == 24:
-            return cls.PCM_S24LE
-        return cls.PCM_S32LE
+            return cls.PCM_F64LE if bit_depth > 32 else cls.PCM_F32LE
+        return _PCM_BY_BIT_DEPTH.get(bit_depth, cls.PCM_S32LE)
+
+
+# lookup of all known ContentType values (and aliases) for ContentType.try_parse
+_CONTENT_TYPES: dict[str, ContentType] = {
+    **{x.value: x for x in ContentType if x is not ContentType.UNKNOWN},
+    "wv": ContentType.WAVPACK,
+}
+# translation table to split on both "." and "," in ContentType.try_parse
+_SPLITTER_TABLE = str.maketrans({",": "."})
+# (integer) PCM ContentType by bit depth for ContentType.from_bit_depth
+_PCM_BY_BIT_DEPTH: dict[int, ContentType] = {
+    16: ContentType.PCM_S16LE,
+    24: ContentType.PCM_S24LE,
+    32: ContentType.PCM_S32LE,
+}
+_PCM_CONTENT_TYPES = frozenset(x for x in ContentType if x.name.startswith("PCM"))
+_LOSSLESS_CONTENT_TYPES = _PCM_CONTENT_TYPES | frozenset(
+    {
+        ContentType.DSF,
+        ContentType.FLAC,
+        ContentType.AIFF,
+        ContentType.WAV,
+        ContentType.ALAC,
+        ContentType.WAVPACK,
+        ContentType.TAK,
+        ContentType.APE,
+        ContentType.TRUEHD,
+        ContentType.DSD_LSBF,
+        ContentType.DSD_MSBF,
+        ContentType.DSD_LSBF_PLANAR,
+        ContentType.DSD_MSBF_PLANAR,
+        ContentType.RA_144,
+    }
+)
 
 
 class QueueOption(StrEnum):
@@ -365,14 +387,17 @@ class PlayerFeature(StrEnum):
     UNKNOWN = "unknown"
 
     @classmethod
-    def _missing_(cls, value: object) -> PlayerFeature:
+    def _missing_(cls, value: object) -> PlayerFeature:  # noqa: ARG003
         """Set default enum member if an unknown value is provided."""
-        if value == "sync":
-            # sync is deprecated, use set_members instead
-            return cls.SET_MEMBERS
         return cls.UNKNOWN
 
 
+# (deprecated) aliases are registered in the value map so they resolve without _missing_,
+# note that this also makes `"sync" in PlayerFeature` true (iteration is not affected)
+# sync is deprecated, use set_members instead
+PlayerFeature._value2member_map_["sync"] = PlayerFeature.SET_MEMBERS
+
+
 class EventType(StrEnum):
     """Enum with possible Events."""
 
@@ -513,6 +538,7 @@ class StreamType(StrEnum):
     CUSTOM = "custom"
 
 
+@unique
 class CacheCategory(IntEnum):
     """Enum with predefined cache categories."""
 
@@ -528,6 +554,19 @@ class CacheCategory(IntEnum):
     LIBRARY_ITEMS = 9
 
 
+# plain int values of the cache categories, for use in hot (cache) code paths
+CACHE_DEFAULT: Final[int] = CacheCategory.DEFAULT.value
+CACHE_MUSIC_SEARCH: Final[int] = CacheCategory.MUSIC_SEARCH.value
+CACHE_MUSIC_ALBUM_TRACKS: Final[int] = CacheCategory.MUSIC_ALBUM_TRACKS.value
+CACHE_MUSIC_ARTIST_TRACKS: Final[int] = CacheCategory.MUSIC_ARTIST_TRACKS.value
+CACHE_MUSIC_ARTIST_ALBUMS: Final[int] = CacheCategory.MUSIC_ARTIST_ALBUMS.value
+CACHE_MUSIC_PLAYLIST_TRACKS: Final[int] = CacheCategory.MUSIC_PLAYLIST_TRACKS.value
+CACHE_MUSIC_PROVIDER_ITEM: Final[int] = CacheCategory.MUSIC_PROVIDER_ITEM.value
+CACHE_PLAYER_QUEUE_STATE: Final[int] = CacheCategory.PLAYER_QUEUE_STATE.value
+CACHE_MEDIA_INFO: Final[int] = CacheCategory.MEDIA_INFO.value
+CACHE_LIBRARY_ITEMS: Final[int] = CacheCategory.LIBRARY_ITEMS.value
+
+
 class VolumeNormalizationMode(StrEnum):
     """Enum with possible VolumeNormalization modes."""
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, TypeGuard
 
-from mashumaro import DataClassDictMixin
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from music_assistant_models.enums import MediaType
 from music_assistant_models.errors import InvalidDataError
@@ -31,6 +32,7 @@ from .metadata import MediaItemChapter, MediaItemImage, MediaItemLink, MediaItem
 from .provider_mapping import ProviderMapping
 
 __all__ = [
+    "MEDIA_ITEM_CLASSES",
     "Album",
     "Artist",
     "AudioFormat",
@@ -75,41 +77,43 @@ PlayableMediaItemType = Track | Radio | Audiobook | PluginSource | PodcastEpisod
 
 
 @dataclass(kw_only=True)
-class SearchResults(DataClassDictMixin):
+class SearchResults(DataClassORJSONMixin):
     """Model for results from a search query."""
 
-    artists: Sequence[Artist | ItemMapping] = field(default_factory=list)
-    albums: Sequence[Album | ItemMapping] = field(default_factory=list)
-    tracks: Sequence[Track | ItemMapping] = field(default_factory=list)
-    playlists: Sequence[Playlist | ItemMapping] = field(default_factory=list)
-    radio: Sequence[Radio | ItemMapping] = field(default_factory=list)
-    audiobooks: Sequence[Audiobook | ItemMapping] = field(default_factory=list)
-    podcasts: Sequence[Podcast | ItemMapping] = field(default_factory=list)
+    artists: Sequence[Artist | ItemMapping] = ()
+    albums: Sequence[Album | ItemMapping] = ()
+    tracks: Sequence[Track | ItemMapping] = ()
+    playlists: Sequence[Playlist | ItemMapping] = ()
+    radio: Sequence[Radio | ItemMapping] = ()
+    audiobooks: Sequence[Audiobook | ItemMapping] = ()
+    podcasts: Sequence[Podcast | ItemMapping] = ()
+
+
+# media_type -> MediaItem class lookup (used by media_from_dict)
+_MEDIA_ITEM_CLASSES: dict[MediaType, type[MediaItemType]] = {
+    MediaType.ARTIST: Artist,
+    MediaType.ALBUM: Album,
+    MediaType.TRACK: Track,
+    MediaType.PLAYLIST: Playlist,
+    MediaType.RADIO: Radio,
+    MediaType.AUDIOBOOK: Audiobook,
+    MediaType.PODCAST: Podcast,
+    MediaType.PODCAST_EPISODE: PodcastEpisode,
+}
+
+# (read-only) public view of the lookup
+MEDIA_ITEM_CLASSES: Mapping[MediaType, type[MediaItemType]] = MappingProxyType(_MEDIA_ITEM_CLASSES)
 
 
 def media_from_dict(media_item: dict[str, Any]) -> MediaItemType | ItemMapping:
     """Return MediaItem from dict."""
     if "provider_mappings" not in media_item:
         return ItemMapping.from_dict(media_item)
-    if media_item["media_type"] == "artist":
-        return Artist.from_dict(media_item)
-    if media_item["media_type"] == "album":
-        return Album.from_dict(media_item)
-    if media_item["media_type"] == "track":
-        return Track.from_dict(media_item)
-    if media_item["media_type"] == "playlist":
-        return Playlist.from_dict(media_item)
-    if media_item["media_type"] == "radio":
-        return Radio.from_dict(media_item)
-    if media_item["media_type"] == "audiobook":
-        return Audiobook.from_dict(media_item)
-    if media_item["media_type"] == "podcast":
-        return Podcast.from_dict(media_item)
-    if media_item["media_type"] == "podcast_episode":
-        return PodcastEpisode.from_dict(media_item)
-    raise InvalidDataError("Unknown media type")
+    if (media_item_cls := _MEDIA_ITEM_CLASSES.get(media_item["media_type"])) is None:
+        raise InvalidDataError("Unknown media type")
+    return media_item_cls.from_dict(media_item)
 
 
 def is_track(val: MediaItem) -> TypeGuard[Track]:
     """Return true if this MediaItem is a track."""
-    return val.media_type == MediaType.TRACK
+    return val.media_type is MediaType.TRACK
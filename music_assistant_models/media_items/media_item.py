@@ -158,8 +158,17 @@ class ItemMapping(_MediaItemBase):
                     continue
                 thumb_image = img
                 break
-        return cls.from_dict(
-            {**item.to_dict(), "image": thumb_image.to_dict() if thumb_image else None}
+        # construct directly instead of a (much more expensive) to_dict/from_dict round trip
+        return cls(
+            item_id=item.item_id,
+            provider=item.provider,
+            name=item.name,
+            version=item.version,
+            sort_name=item.sort_name,
+            uri=item.uri,
+            external_ids=set(item.external_ids),
+            media_type=item.media_type,
+            image=thumb_image,
         )
 
 
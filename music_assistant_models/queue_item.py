@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Self
+from dataclasses import dataclass, replace
+from typing import Annotated, Any, Self
 from uuid import uuid4
 
-from mashumaro import DataClassDictMixin
+from mashumaro.exceptions import InvalidFieldValue
+from mashumaro.mixins.orjson import DataClassORJSONMixin
+from mashumaro.types import Discriminator
 
 from .enums import MediaType
-from .media_items import ItemMapping, MediaItemImage, PlayableMediaItemType, UniqueList, is_track
+from .media_items import (
+    ItemMapping,
+    MediaItemImage,
+    PlayableMediaItemType,
+    UniqueList,
+    is_track,
+)
 from .streamdetails import StreamDetails
 
 
-@dataclass
-class QueueItem(DataClassDictMixin):
+@dataclass(slots=True)
+class QueueItem(DataClassORJSONMixin):
     """Representation of a queue item."""
 
     queue_id: str
@@ -23,50 +31,68 @@ class QueueItem(DataClassDictMixin):
     duration: int | None
     sort_index: int = 0
     streamdetails: StreamDetails | None = None
-    media_item: PlayableMediaItemType | None = None
+    # discriminate on media_type so the matching class is picked directly
+    media_item: (
+        Annotated[
+            PlayableMediaItemType,
+            Discriminator(field="media_type", include_supertypes=True),
+        ]
+        | None
+    ) = None
     image: MediaItemImage | None = None
     index: int = 0
 
     def __post_init__(self) -> None:
         """Set default values."""
-        if not self.name and self.streamdetails and self.streamdetails.stream_title:
-            self.name = self.streamdetails.stream_title
         if not self.name:
-            self.name = self.uri
+            streamdetails = self.streamdetails
+            self.name = (streamdetails.stream_title if streamdetails else None) or self.uri
 
     @property
     def uri(self) -> str:
         """Return uri for this QueueItem (for logging purposes)."""
-        if self.media_item and self.media_item.uri:
-            return self.media_item.uri
+        if (media_item := self.media_item) and (uri := media_item.uri):
+            return uri
         return self.queue_item_id
 
     @property
     def media_type(self) -> MediaType:
         """Return MediaType for this QueueItem (for convenience purposes)."""
-        if self.media_item:
-            return self.media_item.media_type
-        if self.streamdetails:
-            return self.streamdetails.media_type
+        if media_item := self.media_item:
+            return media_item.media_type
+        if streamdetails := self.streamdetails:
+            return streamdetails.media_type
         return MediaType.UNKNOWN
 
     @classmethod
-    def from_media_item(cls, queue_id: str, media_item: PlayableMediaItemType) -> QueueItem:
-        """Construct QueueItem from track/radio item."""
-        if is_track(media_item) and hasattr(media_item, "artists"):
-            artists = "/".join(x.name for x in media_item.artists)
-            name = f"{artists} - {media_item.name}"
-            if media_item.version:
-                name = f"{name} ({media_item.version})"
+    def from_media_item(
+        cls,
+        queue_id: str,
+        media_item: PlayableMediaItemType,
+        queue_item_id: str | None = None,
+    ) -> QueueItem:
+        """Construct QueueItem from track/radio item.
+
+        A queue_item_id is generated if not provided by the caller.
+        """
+        if is_track(media_item):
             # save a lot of data/bandwidth by simplifying nested objects
-            media_item.artists = UniqueList([ItemMapping.from_item(x) for x in media_item.artists])
+            artist_names: list[str] = []
+            artist_mappings: list[ItemMapping] = []
+            for artist in media_item.artists:
+                artist_names.append(artist.name)
+                artist_mappings.append(ItemMapping.from_item(artist))
+            media_item.artists = UniqueList(artist_mappings)
+            name = f"{'/'.join(artist_names)} - {media_item.name}"
+            if version := media_item.version:
+                name = f"{name} ({version})"
             if media_item.album:
                 media_item.album = ItemMapping.from_item(media_item.album)
         else:
             name = media_item.name
         return cls(
             queue_id=queue_id,
-            queue_item_id=uuid4().hex,
+            queue_item_id=queue_item_id or uuid4().hex,
             name=name,
             duration=media_item.duration,
             media_item=media_item,
@@ -75,27 +101,44 @@ class QueueItem(DataClassDictMixin):
 
     def to_cache(self) -> dict[str, Any]:
         """Return the dict that is suitable for storing into the cache db."""
-        base = self.to_dict()
+        # serialize (a shallow copy) without streamdetails so it is never encoded
+        src = replace(self, streamdetails=None) if self.streamdetails is not None else self
+        base = src.to_dict()
         base.pop("streamdetails", None)
         return base
 
     @classmethod
     def from_cache(cls, d: dict[Any, Any]) -> Self:
-        """Restore a QueueItem from a cache dict."""
+        """Restore a QueueItem from a cache dict.
+
+        A cached media_item that can not be restored (e.g. an incomplete item or an
+        unsupported media_type, stored by an older version) is dropped,
+        instead of failing to restore the whole QueueItem.
+        """
         d.pop("streamdetails", None)
+        try:
+            return cls.from_dict(d)
+        except InvalidFieldValue as err:
+            if err.field_name != "media_item":
+                raise
+        d["media_item"] = None
         return cls.from_dict(d)
 
 
 def get_image(media_item: PlayableMediaItemType | None) -> MediaItemImage | None:
-    """Find the Image for the MediaItem."""
+    """Find the Image for the MediaItem.
+
+    Falls back to the album (track) or podcast (episode) image.
+    QueueItem resolves this once at construction, later image changes are not reflected.
+    """
     if not media_item:
         return None
     if media_item.image:
         return media_item.image
-    if media_item.media_type == MediaType.TRACK and (album := getattr(media_item, "album", None)):
-        return get_image(album)
-    if media_item.media_type == MediaType.PODCAST_EPISODE and (
-        podcast := getattr(media_item, "podcast", None)
-    ):
-        return get_image(podcast)
-    return None
+    if media_item.media_type is MediaType.TRACK:
+        parent = getattr(media_item, "album", None)
+    elif media_item.media_type is MediaType.PODCAST_EPISODE:
+        parent = getattr(media_item, "podcast", None)
+    else:
+        return None
+    return parent.image if parent else None
@@ -0,0 +1,91 @@
+"""Tests for the config entries and Config models."""
+
+from enum import IntEnum
+
+import pytest
+
+from music_assistant_models.config_entries import Config, ConfigEntry, ConfigValueOption
+from music_assistant_models.constants import SECURE_STRING_SUBSTITUTE
+from music_assistant_models.enums import ConfigEntryType
+
+
+class _Level(IntEnum):
+    """IntEnum used as (subclassed) int value."""
+
+    LOW = 1
+    HIGH = 3
+
+
+def test_parse_value_coercion() -> None:
+    """Test the common type conversions in ConfigEntry.parse_value."""
+    float_entry = ConfigEntry(key="float", type=ConfigEntryType.FLOAT, label="float")
+    assert float_entry.parse_value(2) == 2.0
+    assert isinstance(float_entry.value, float)
+    assert float_entry.parse_value("1.5") == 1.5
+    int_entry = ConfigEntry(key="int", type=ConfigEntryType.INTEGER, label="int")
+    assert int_entry.parse_value(2.7) == 2
+    assert int_entry.parse_value("5") == 5
+
+
+def test_parse_value_coercion_subclass() -> None:
+    """Test that subclasses of int/float are converted too."""
+    entry = ConfigEntry(key="float", type=ConfigEntryType.FLOAT, label="float")
+    assert entry.parse_value(_Level.HIGH) == 3.0
+    assert type(entry.value) is float
+
+
+def test_parse_copies_list_default() -> None:
+    """Test that Config.parse does not share a list default_value between configs."""
+    entry = ConfigEntry(
+        key="lst",
+        type=ConfigEntryType.STRING,
+        label="lst",
+        default_value=["a"],
+        multi_value=True,
+    )
+    conf1 = Config.parse([entry], {"values": {}})
+    conf2 = Config.parse([entry], {"values": {}})
+    value = conf1.values["lst"].value
+    assert isinstance(value, list)
+    value.append("b")
+    assert entry.default_value == ["a"]
+    assert conf2.values["lst"].value == ["a"]
+
+
+def test_parse_options_tuple() -> None:
+    """Test that Config.parse stores options passed as a list as a tuple."""
+    options = [ConfigValueOption(title="A", value="a"), ConfigValueOption(title="B", value="b")]
+    entry = ConfigEntry(
+        key="opt",
+        type=ConfigEntryType.STRING,
+        label="opt",
+        options=options,  # type: ignore[arg-type]
+    )
+    conf = Config.parse([entry], {"values": {"opt": "b"}})
+    assert conf.values["opt"].options == tuple(options)
+    assert conf.values["opt"].value == "b"
+    # the definition is not modified
+    assert entry.options is options
+
+
+def test_secure_string_masked() -> None:
+    """Test that SECURE_STRING values are never serialized in plain text."""
+    entry = ConfigEntry(key="pw", type=ConfigEntryType.SECURE_STRING, label="pw")
+    conf = Config.parse([entry], {"values": {"pw": "secret"}})
+    assert conf.to_dict()["values"]["pw"]["value"] == SECURE_STRING_SUBSTITUTE
+    # entries added after parsing must be masked too
+    conf.values["pw2"] = ConfigEntry(
+        key="pw2", type=ConfigEntryType.SECURE_STRING, label="pw2", value="leak"
+    )
+    assert conf.to_dict()["values"]["pw2"]["value"] == SECURE_STRING_SUBSTITUTE
+
+
+def test_parse_value_integer_tuple() -> None:
+    """Test parsing INTEGER_TUPLE values."""
+    entry = ConfigEntry(key="tup", type=ConfigEntryType.INTEGER_TUPLE, label="tup")
+    assert entry.parse_value([1, 2]) == (1, 2)
+    assert entry.parse_value(("3", 4.0)) == (3, 4)  # type: ignore[arg-type]
+    assert entry.parse_value(None) is None
+    for invalid in (["a", "b"], [1, 2, 3], ("a", "b"), 5):
+        with pytest.raises(ValueError, match="unexpected type"):
+            entry.parse_value(invalid)  # type: ignore[arg-type]
@@ -0,0 +1,56 @@
+"""Tests for the DSP models."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from music_assistant_models.dsp import (
+    DSPConfig,
+    ParametricEQBand,
+    ParametricEQBandType,
+    ParametricEQFilter,
+    ToneControlFilter,
+)
+
+
+def test_parametric_eq_band_frozen() -> None:
+    """Test that a ParametricEQBand can not be modified (and can be hashed)."""
+    band = ParametricEQBand(frequency=100.0, gain=3.0)
+    with pytest.raises(FrozenInstanceError):
+        band.gain = 6.0  # type: ignore[misc]
+    assert hash(band) == hash(ParametricEQBand(frequency=100.0, gain=3.0))
+
+
+def test_dsp_config_roundtrip() -> None:
+    """Test a to_dict/from_dict round trip of a DSPConfig with (slotted) filters."""
+    config = DSPConfig(
+        enabled=True,
+        filters=[
+            ParametricEQFilter(
+                enabled=True,
+                preamp=-2.0,
+                bands=[
+                    ParametricEQBand(frequency=60.0, gain=4.0, type=ParametricEQBandType.LOW_SHELF),
+                    ParametricEQBand(frequency=8000.0, q=0.7, gain=-3.0, enabled=False),
+                ],
+            ),
+            ToneControlFilter(enabled=False, bass_level=2.0, treble_level=-1.5),
+        ],
+        input_gain=-6.0,
+        output_gain=1.0,
+    )
+    config.validate()
+    restored = DSPConfig.from_dict(config.to_dict())
+    assert restored == config
+    assert isinstance(restored.filters[0], ParametricEQFilter)
+    assert isinstance(restored.filters[1], ToneControlFilter)
+    assert DSPConfig.from_json(config.to_json()) == config
+
+
+def test_parametric_eq_band_type_from_str() -> None:
+    """Test that an unknown band type is deserialized as UNKNOWN."""
+    assert ParametricEQBandType.from_str("low_pass") is ParametricEQBandType.LOW_PASS
+    assert ParametricEQBandType.from_str("invalid") is ParametricEQBandType.UNKNOWN
+    band = ParametricEQBand.from_dict({"frequency": 100.0, "type": "invalid"})
+    assert band.type is ParametricEQBandType.UNKNOWN
+    assert ParametricEQBand.from_dict({"type": "notch"}).type is ParametricEQBandType.NOTCH
@@ -0,0 +1,104 @@
+"""Tests for the enums and their helpers."""
+
+from music_assistant_models.enums import (
+    CACHE_DEFAULT,
+    CACHE_LIBRARY_ITEMS,
+    CACHE_MEDIA_INFO,
+    CACHE_PLAYER_QUEUE_STATE,
+    CacheCategory,
+    ContentType,
+    ExternalID,
+    MediaType,
+    PlayerFeature,
+)
+
+
+def test_external_id_properties() -> None:
+    """Test the is_musicbrainz and is_unique properties of ExternalID."""
+    assert ExternalID.MB_RECORDING.is_musicbrainz
+    assert ExternalID.MB_RECORDING.is_unique
+    assert not ExternalID.ACOUSTID.is_musicbrainz
+    assert ExternalID.ACOUSTID.is_unique
+    assert not ExternalID.ISRC.is_musicbrainz
+    assert not ExternalID.ISRC.is_unique
+    assert not ExternalID.UNKNOWN.is_unique
+
+
+def test_content_type_is_lossless() -> None:
+    """Test ContentType.is_lossless."""
+    assert ContentType.FLAC.is_lossless()
+    assert ContentType.DSD_MSBF.is_lossless()
+    assert ContentType.PCM_S24LE.is_lossless()
+    assert ContentType.PCM_ALAW.is_lossless()
+    assert not ContentType.MP3.is_lossless()
+    assert not ContentType.AAC.is_lossless()
+    assert not ContentType.UNKNOWN.is_lossless()
+
+
+def test_content_type_is_pcm() -> None:
+    """Test ContentType.is_pcm."""
+    assert ContentType.PCM.is_pcm()
+    assert ContentType.PCM_F32LE.is_pcm()
+    assert ContentType.PCM_MULAW.is_pcm()
+    assert not ContentType.FLAC.is_pcm()
+    assert not ContentType.DSD_LSBF.is_pcm()
+
+
+def test_content_type_try_parse() -> None:
+    """Test ContentType.try_parse."""
+    assert ContentType.try_parse("flac") == ContentType.FLAC
+    assert ContentType.try_parse("MP3") == ContentType.MP3
+    assert ContentType.try_parse("audio/aac") == ContentType.AAC
+    assert ContentType.try_parse("wv") == ContentType.WAVPACK
+    assert ContentType.try_parse("pcm_s16le") == ContentType.PCM_S16LE
+    assert ContentType.try_parse("pcm_bluray") == ContentType.PCM_BLURAY
+    assert ContentType.try_parse("adpcm_ms") == ContentType.ADPCM_MS
+    assert ContentType.try_parse("/home/user/music/track.m4a") == ContentType.M4A
+    assert ContentType.try_parse("https://example.com/stream.ogg") == ContentType.OGG
+    assert ContentType.try_parse("audio/mp4,aac") == ContentType.MP4
+    assert ContentType.try_parse("/home/user/music/track.wv") == ContentType.WAVPACK
+    assert ContentType.try_parse("something") == ContentType.UNKNOWN
+
+
+def test_media_type_all() -> None:
+    """Test MediaType.ALL."""
+    assert MediaType.ALL == (
+        MediaType.ARTIST,
+        MediaType.ALBUM,
+        MediaType.TRACK,
+        MediaType.PLAYLIST,
+        MediaType.RADIO,
+        MediaType.AUDIOBOOK,
+        MediaType.PODCAST,
+    )
+    assert MediaType.ALL is MediaType.ALL
+
+
+def test_content_type_from_bit_depth() -> None:
+    """Test ContentType.from_bit_depth."""
+    assert ContentType.from_bit_depth(16) == ContentType.PCM_S16LE
+    assert ContentType.from_bit_depth(24) == ContentType.PCM_S24LE
+    assert ContentType.from_bit_depth(32) == ContentType.PCM_S32LE
+    assert ContentType.from_bit_depth(8) == ContentType.PCM_S32LE
+    assert ContentType.from_bit_depth(32, floating_point=True) == ContentType.PCM_F32LE
+    assert ContentType.from_bit_depth(64, floating_point=True) == ContentType.PCM_F64LE
+
+
+def test_cache_category_constants() -> None:
+    """Test the plain int CacheCategory constants."""
+    assert CACHE_DEFAULT == CacheCategory.DEFAULT
+    assert CACHE_PLAYER_QUEUE_STATE == CacheCategory.PLAYER_QUEUE_STATE
+    assert type(CACHE_LIBRARY_ITEMS) is int
+    assert {CacheCategory.MEDIA_INFO: True}[CACHE_MEDIA_INFO]
+
+
+def test_player_feature_alias() -> None:
+    """Test the deprecated PlayerFeature alias and unknown values."""
+    assert PlayerFeature("sync") is PlayerFeature.SET_MEMBERS
+    assert PlayerFeature("set_members") is PlayerFeature.SET_MEMBERS
+    assert PlayerFeature("no_such_feature") is PlayerFeature.UNKNOWN
+    # the alias is a value of the enum, but not an extra member
+    assert "sync" in PlayerFeature
+    assert "no_such_feature" not in PlayerFeature
+    assert "sync" not in [feature.value for feature in PlayerFeature]
+    assert list(PlayerFeature).count(PlayerFeature.SET_MEMBERS) == 1
@@ -0,0 +1,97 @@
+"""Tests for the media item models."""
+
+from types import MappingProxyType
+
+import pytest
+
+from music_assistant_models.enums import ExternalID, ImageType, MediaType
+from music_assistant_models.errors import InvalidDataError
+from music_assistant_models.media_items import (
+    MEDIA_ITEM_CLASSES,
+    Album,
+    Artist,
+    Audiobook,
+    ItemMapping,
+    MediaItem,
+    MediaItemImage,
+    MediaItemMetadata,
+    Playlist,
+    Podcast,
+    PodcastEpisode,
+    Radio,
+    Track,
+    UniqueList,
+    media_from_dict,
+)
+
+_BASE = {"item_id": "1", "provider": "test", "name": "Test", "provider_mappings": []}
+_PODCAST = {"item_id": "2", "provider": "test", "name": "Podcast", "media_type": "podcast"}
+
+
+@pytest.mark.parametrize(
+    ("media_type", "media_cls", "extra"),
+    [
+        (MediaType.ARTIST, Artist, {}),
+        (MediaType.ALBUM, Album, {}),
+        (MediaType.TRACK, Track, {}),
+        (MediaType.PLAYLIST, Playlist, {}),
+        (MediaType.RADIO, Radio, {}),
+        (MediaType.AUDIOBOOK, Audiobook, {}),
+        (MediaType.PODCAST, Podcast, {}),
+        (MediaType.PODCAST_EPISODE, PodcastEpisode, {"position": 1, "podcast": _PODCAST}),
+    ],
+)
+def test_media_from_dict(
+    media_type: MediaType, media_cls: type[MediaItem], extra: dict[str, object]
+) -> None:
+    """Test that media_from_dict returns the class for the (raw) media_type."""
+    assert MEDIA_ITEM_CLASSES[media_type] is media_cls
+    item = media_from_dict({**_BASE, **extra, "media_type": media_type.value})
+    assert type(item) is media_cls
+    assert item.media_type is media_type
+    assert media_from_dict(item.to_dict()) == item
+
+
+def test_media_from_dict_item_mapping() -> None:
+    """Test that a dict without provider_mappings is returned as ItemMapping."""
+    item = media_from_dict(_PODCAST)
+    assert type(item) is ItemMapping
+    assert item.media_type is MediaType.PODCAST
+
+
+def test_media_from_dict_unknown_type() -> None:
+    """Test that an unknown (or unsupported) media_type raises InvalidDataError."""
+    for media_type in ("folder", "unknown", "invalid"):
+        with pytest.raises(InvalidDataError, match="Unknown media type"):
+            media_from_dict({**_BASE, "media_type": media_type})
+
+
+def test_media_item_classes_read_only() -> None:
+    """Test that the public MediaType -> class lookup can not be modified."""
+    assert isinstance(MEDIA_ITEM_CLASSES, MappingProxyType)
+    with pytest.raises(TypeError):
+        MEDIA_ITEM_CLASSES[MediaType.FOLDER] = Track  # type: ignore[index]
+
+
+def test_item_mapping_from_item() -> None:
+    """Test that ItemMapping.from_item matches the (previous) dict round trip."""
+    thumb = MediaItemImage(type=ImageType.THUMB, path="thumb.jpg", provider="test")
+    track = Track(
+        **_BASE,
+        version="Remastered",
+        sort_name="test",
+        external_ids={(ExternalID.ISRC, "NL1234567890"), (ExternalID.BARCODE, "123")},
+        metadata=MediaItemMetadata(
+            images=UniqueList(
+                [MediaItemImage(type=ImageType.FANART, path="fanart.jpg", provider="test"), thumb]
+            )
+        ),
+    )
+    mapping = ItemMapping.from_item(track)
+    expected = ItemMapping.from_dict({**track.to_dict(), "image": thumb.to_dict()})
+    assert mapping.to_dict() == expected.to_dict()
+    assert mapping.image == thumb
+    # the external_ids are not shared with the item
+    assert mapping.external_ids == track.external_ids
+    assert mapping.external_ids is not track.external_ids
+    assert ItemMapping.from_item(mapping) is mapping
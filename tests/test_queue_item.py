@@ -0,0 +1,64 @@
+"""Tests for the QueueItem model."""
+
+import pytest
+
+from music_assistant_models.enums import MediaType
+from music_assistant_models.media_items import (
+    Audiobook,
+    AudioFormat,
+    ItemMapping,
+    PluginSource,
+    PodcastEpisode,
+    Radio,
+    Track,
+)
+from music_assistant_models.queue_item import QueueItem
+from music_assistant_models.streamdetails import StreamDetails
+
+_BASE = {"item_id": "1", "provider": "test", "name": "Test", "provider_mappings": set()}
+_PODCAST = ItemMapping(item_id="2", provider="test", name="Podcast", media_type=MediaType.PODCAST)
+
+
+@pytest.mark.parametrize(
+    "media_item",
+    [
+        Track(**_BASE),
+        Radio(**_BASE),
+        Audiobook(**_BASE),
+        PluginSource(**_BASE),
+        PodcastEpisode(**_BASE, position=1, podcast=_PODCAST),
+    ],
+)
+def test_cache_roundtrip(
+    media_item: Track | Radio | Audiobook | PluginSource | PodcastEpisode,
+) -> None:
+    """Test that each playable media type survives a to_cache/from_cache round trip."""
+    queue_item = QueueItem.from_media_item("queue", media_item)
+    restored = QueueItem.from_cache(queue_item.to_cache())
+    assert type(restored.media_item) is type(media_item)
+    assert restored.media_item == media_item
+    assert restored == queue_item
+
+
+def test_from_cache_invalid_media_item() -> None:
+    """Test that a cached media_item that can not be restored is dropped."""
+    cached = QueueItem.from_media_item("queue", Radio(**_BASE)).to_cache()
+    cached["media_item"]["media_type"] = "artist"
+    restored = QueueItem.from_cache(cached)
+    assert restored.media_item is None
+    assert restored.name == "Test"
+    cached = QueueItem.from_media_item("queue", Radio(**_BASE)).to_cache()
+    del cached["media_item"]["provider_mappings"]
+    assert QueueItem.from_cache(cached).media_item is None
+
+
+def test_to_cache_without_streamdetails() -> None:
+    """Test that streamdetails are never cached (and are kept on the QueueItem)."""
+    queue_item = QueueItem.from_media_item("queue", Track(**_BASE))
+    queue_item.streamdetails = StreamDetails(
+        provider="test", item_id="1", audio_format=AudioFormat()
+    )
+    cached = queue_item.to_cache()
+    assert "streamdetails" not in cached
+    assert queue_item.streamdetails is not None
+    assert QueueItem.from_cache(cached).streamdetails is None